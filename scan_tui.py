@@ -6,25 +6,69 @@ from __future__ import annotations
 import asyncio
 import importlib
 import json
+import os
 import re
 import shlex
-import shutil
 import subprocess
 import sys
 import site
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from time import monotonic
 
+try:
+    import orjson
+except ImportError:  # optional C-accelerated JSON codec
+    orjson = None
+
 TEXTUAL_REQUIREMENT = "textual>=0.52"
 CONFIG_PATH = Path.home() / ".config" / "scan_tui" / "config.json"
 HISTORY_PATH = Path.home() / ".config" / "scan_tui" / "history.jsonl"
+DEFAULT_OUTPUT_DIR = Path("./scans")
 RESOLUTION_PRESETS = [150, 300, 600]
 FORMAT_OPTIONS = ["png", "jpeg", "tiff", "pdf", "pnm"]
 MODE_OPTIONS = ["", "Color", "Gray", "Lineart"]
 SOURCE_OPTIONS = ["", "Flatbed", "ADF", "ADF Duplex"]
+FREE_SPACE_TTL = 2.0
+SETTINGS_SAVE_DELAY = 0.5
+SPINNER_DELAY = 0.5
+LOG_MAX_LINES = 1000
+NEXT_INDEX_CACHE_SIZE = 256
+INPUT_DEBOUNCE = 0.25
+HISTORY_FLUSH_DELAY = 5.0
+OUTPUT_CAPTURE_LIMIT = 64 * 1024
+XDG_OPEN_INTERVAL = 0.5
+
+HELP_TEXT = "\n".join(
+    [
+        "[bold]Keyboard cheatsheet[/bold]",
+        "Space/Enter: Scan   P: Prefix   T: Date prefix   Y: Date dir",
+        "1: Doc preset  2: Photo preset  3: Draft preset",
+        "G: Gray toggle  D: DPI cycle  O: Source cycle  M: Format cycle",
+        "V: Open last  E: Open dir  K: Beep  Z: Log  X: Clear error  U: Auto-continue",
+    ]
+)
+
+_AUTO_ON_LABEL = "Auto-continue: On (U)"
+_AUTO_OFF_LABEL = "Auto-continue: Off (U)"
+
+_MSG_SCAN_START = "[cyan]Scanning[/cyan] {name} on {dev}"
+_MSG_SAVED = "[green]Saved:[/green] {path}{size} in {secs:.2f}s"
+_MSG_SCAN_FAILED = "[red]scanimage failed:[/red] {error}"
+_MSG_LAST_ERROR = "[red]Last error:[/red] {message}"
+_MSG_MODE = "[blue]Mode:[/blue] {value}"
+_MSG_RESOLUTION = "[blue]Resolution:[/blue] {value} DPI"
+_MSG_SOURCE = "[blue]Source:[/blue] {value}"
+_MSG_FORMAT = "[blue]Format:[/blue] {value}"
+_MSG_AUTO_CONTINUE = "[blue]Auto-continue:[/blue] {value}"
+_MSG_OUTPUT_DIR = "[blue]Output dir:[/blue] {value}"
+_MSG_BEEP = "[blue]Beep:[/blue] {value}"
+_MSG_LOG = "[blue]Log:[/blue] {value}"
+_MSG_PRESET = "[magenta]Preset:[/magenta] {value}"
+_MSG_OPENED = "[green]Opened:[/green] {path}"
 
 
 def _install_textual() -> None:
@@ -71,17 +115,21 @@ def _ensure_user_site_on_path() -> None:
 
 
 try:
-    _ensure_user_site_on_path()
     import textual  # noqa: F401
 except ModuleNotFoundError:
-    _install_textual()
-    importlib.invalidate_caches()
     _ensure_user_site_on_path()
-    import textual  # noqa: F401
+    try:
+        import textual  # noqa: F401
+    except ModuleNotFoundError:
+        _install_textual()
+        importlib.invalidate_caches()
+        _ensure_user_site_on_path()
+        import textual  # noqa: F401
 
 from textual import events
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     Footer,
@@ -94,6 +142,13 @@ from textual.widgets import (
     Static,
 )
 
+try:
+    from textual.widgets._select import SelectOverlay
+
+    _INPUTLIKE: Tuple[type, ...] = (Input, Select, SelectOverlay)
+except Exception:  # private module; layout varies across Textual versions
+    _INPUTLIKE = (Input, Select)
+
 
 @dataclass(frozen=True)
 class ScannerInfo:
@@ -102,24 +157,27 @@ class ScannerInfo:
     raw: str
 
 
-SCAN_LINE_RE = re.compile(r"device\s+(.+?)\s+is\s+(.+)")
+SCAN_LINE_RE = re.compile(
+    r"^[ \t]*(?P<raw>.*?device[ \t]+[`'\"]?(?P<device>.+?)[`'\"]?[ \t]+is[ \t]+(?P<name>.+?))[ \t\r]*$",
+    re.MULTILINE,
+)
+_PREFIX_SANITIZE_RE = re.compile(r"[^A-Za-z0-9._-]+")
+_DATE_DIR_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_SANITIZE_TABLE = str.maketrans({" ": "_", "/": "_", "\\": "_"})
+_FMT_TO_EXT = {"jpeg": "jpg"}
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
 
 def parse_scanimage_list(output: str) -> List[ScannerInfo]:
-    scanners: List[ScannerInfo] = []
     seen = set()
-    for line in output.splitlines():
-        match = SCAN_LINE_RE.search(line)
-        if not match:
-            continue
-        device_raw, name = match.group(1).strip(), match.group(2).strip()
-        device = device_raw.strip("`'\"")
-        if not device:
-            continue
-        if device in seen:
+    scanners: List[ScannerInfo] = []
+    for match in SCAN_LINE_RE.finditer(output):
+        raw, device, name = match.group("raw", "device", "name")
+        # The regex only consumes one quote on each side; quotes inside the name are kept.
+        if not device.strip("`'\"") or device in seen:
             continue
         seen.add(device)
-        scanners.append(ScannerInfo(device=device, name=name, raw=line.strip()))
+        scanners.append(ScannerInfo(device, name, raw))
     return scanners
 
 
@@ -136,49 +194,179 @@ def safe_int(value: str, default: int) -> int:
         return default
 
 
+@lru_cache(maxsize=64)
 def sanitize_prefix(value: str) -> str:
-    cleaned = value.strip().replace(" ", "_")
-    cleaned = cleaned.replace("/", "_").replace("\\", "_")
-    cleaned = re.sub(r"[^A-Za-z0-9._-]+", "_", cleaned)
-    cleaned = cleaned.strip("._-")
-    return cleaned
+    cleaned = value.strip().translate(_SANITIZE_TABLE)
+    cleaned = _PREFIX_SANITIZE_RE.sub("_", cleaned)
+    return cleaned.strip("._-")
 
 
 def is_date_dir(name: str) -> bool:
-    return bool(re.fullmatch(r"\d{4}-\d{2}-\d{2}", name))
+    return bool(_DATE_DIR_RE.fullmatch(name))
+
+
+# (prefix, output_dir, ext) -> (max index, output_dir st_mtime_ns)
+_NEXT_INDEX_CACHE: Dict[Tuple[str, str, str], Tuple[int, int]] = {}
 
 
 def next_index(prefix: str, output_dir: Path, ext: str) -> int:
-    pattern = re.compile(rf"^{re.escape(prefix)}_(\d{{4}}).*\.{re.escape(ext)}$", re.IGNORECASE)
-    max_idx = 0
-    if not output_dir.exists():
+    try:
+        mtime = os.stat(output_dir).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
         return 1
-    for entry in output_dir.iterdir():
-        if not entry.is_file():
-            continue
-        match = pattern.match(entry.name)
-        if match:
-            try:
-                max_idx = max(max_idx, int(match.group(1)))
-            except ValueError:
-                continue
+    key = (prefix, str(output_dir), ext)
+    cached = _NEXT_INDEX_CACHE.get(key)
+    if cached is not None and cached[1] == mtime:
+        return cached[0] + 1
+    max_idx = _scan_max_index(prefix, output_dir, ext)
+    if len(_NEXT_INDEX_CACHE) >= NEXT_INDEX_CACHE_SIZE:
+        _NEXT_INDEX_CACHE.clear()
+    _NEXT_INDEX_CACHE[key] = (max_idx, mtime)
     return max_idx + 1
 
 
+def remember_index(prefix: str, output_dir: Path, ext: str, index: int) -> None:
+    key = (prefix, str(output_dir), ext)
+    try:
+        _NEXT_INDEX_CACHE[key] = (index, os.stat(output_dir).st_mtime_ns)
+    except OSError:
+        _NEXT_INDEX_CACHE.pop(key, None)
+
+
+def forget_index(prefix: str, output_dir: Path, ext: str) -> None:
+    _NEXT_INDEX_CACHE.pop((prefix, str(output_dir), ext), None)
+
+
+def _scan_max_index(prefix: str, output_dir: Path, ext: str) -> int:
+    # Matches "<prefix>_<4 digits>*.<ext>" case-insensitively without a regex.
+    head = f"{prefix}_".lower()
+    tail = f".{ext}".lower()
+    start = len(head)
+    min_len = start + 4 + len(tail)
+    first_chars = (head[0], head[0].upper())
+    max_idx = 0
+    try:
+        it = os.scandir(output_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+    with it:
+        for entry in it:
+            # Cheap first-character reject before lowercasing the whole name.
+            if entry.name[0] not in first_chars:
+                continue
+            name = entry.name.lower()
+            if len(name) < min_len or not name.startswith(head) or not name.endswith(tail):
+                continue
+            digits = name[start : start + 4]
+            if not digits.isdecimal():
+                continue
+            # Only stat entries that look like ours; symlinked scans still count.
+            if not entry.is_file():
+                continue
+            idx = int(digits)
+            if idx > max_idx:
+                max_idx = idx
+    return max_idx
+
+
 def format_bytes(num_bytes: int) -> str:
-    value = float(num_bytes)
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if value < 1024.0:
-            return f"{value:.1f} {unit}"
-        value /= 1024.0
-    return f"{value:.1f} PB"
+    if num_bytes < 1024:
+        return f"{num_bytes} B"
+    idx = min(5, (num_bytes.bit_length() - 1) // 10)
+    return f"{num_bytes / (1 << (idx * 10)):.1f} {_BYTE_UNITS[idx]}"
+
+
+# st_dev -> (expires at, free bytes)
+_FREE_SPACE_CACHE: Dict[int, Tuple[float, int]] = {}
+
+
+def free_bytes(path: Path) -> int:
+    dev = os.stat(path).st_dev
+    now = monotonic()
+    cached = _FREE_SPACE_CACHE.get(dev)
+    if cached is not None and now < cached[0]:
+        return cached[1]
+    stat = os.statvfs(path)
+    free = stat.f_bavail * stat.f_frsize
+    _FREE_SPACE_CACHE[dev] = (now + FREE_SPACE_TTL, free)
+    return free
+
+
+async def _read_tail(stream: asyncio.StreamReader, limit: int) -> bytes:
+    # Drain the pipe fully but only keep the last `limit` bytes (e.g. --debug spew).
+    buffer = bytearray()
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            break
+        buffer += chunk
+        if len(buffer) > limit:
+            del buffer[:-limit]
+    return bytes(buffer)
+
+
+async def run_process(cmd: List[str], timeout: float) -> Tuple[int, str, str]:
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr, _ = await asyncio.wait_for(
+            asyncio.gather(
+                _read_tail(proc.stdout, OUTPUT_CAPTURE_LIMIT),
+                _read_tail(proc.stderr, OUTPUT_CAPTURE_LIMIT),
+                proc.wait(),
+            ),
+            timeout=timeout,
+        )
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return (
+        proc.returncode,
+        stdout.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace"),
+    )
+
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: object, pretty: bool = False) -> bytes:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS if pretty else 0
+        return orjson.dumps(obj, option=option)
+
+else:
+    _json_loads = json.loads
+    _compact_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    def _json_dumps(obj: object, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(obj, indent=2, sort_keys=True).encode("utf-8")
+        return _compact_encode(obj).encode("utf-8")
+
+
+def write_settings(path: Path, data: dict) -> bool:
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as handle:
+            handle.write(_json_dumps(data, pretty=True))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        return False
+    return True
 
 
-def append_history(path: Path, record: dict) -> None:
+def append_history_batch(path: Path, records: List[dict]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as handle:
-        json.dump(record, handle, ensure_ascii=False)
-        handle.write("\n")
+    with path.open("ab", buffering=8192) as handle:
+        for record in records:
+            handle.write(_json_dumps(record) + b"\n")
 
 
 class ScanTUI(App):
@@ -290,24 +478,54 @@ class ScanTUI(App):
         ("z", "toggle_log", "Toggle Log"),
     ]
 
+    _ARROW_KEYS = frozenset({"up", "down", "left", "right"})
+    _BACKWARD_KEYS = frozenset({"up", "left"})
+    _LOG_SCROLL_METHODS = {
+        "up": "scroll_up",
+        "down": "scroll_down",
+        "pageup": "scroll_page_up",
+        "pagedown": "scroll_page_down",
+        "home": "scroll_home",
+        "end": "scroll_end",
+    }
+    # Left/right are swallowed on the log without scrolling.
+    _LOG_KEYS = _ARROW_KEYS | frozenset(_LOG_SCROLL_METHODS)
+
     def __init__(self) -> None:
         super().__init__()
         self._scanners: List[ScannerInfo] = []
+        self._scanner_by_device: Dict[str, ScannerInfo] = {}
+        self._active_device: Optional[str] = None
+        self._output_dir_raw: Optional[str] = None
+        self._output_dir_expanded: Optional[Path] = None
+        self._last_xdg_open: Dict[str, float] = {}
+        self._xdg_procs: List[subprocess.Popen] = []
         self._scan_lock = asyncio.Lock()
         self._stage: str = "select"
         self._advanced: bool = False
-        self._settings = self._load_settings()
+        self._settings: dict = {}
+        self._written_settings: Optional[dict] = None
         self._last_saved: Optional[Path] = None
         self._session_scans: int = 0
         self._last_scan_seconds: Optional[float] = None
         self._scan_queued: bool = False
         self._session_bytes: int = 0
         self._session_total_seconds: float = 0.0
-        self._auto_continue_single: bool = bool(self._settings.get("auto_continue_single", True))
+        self._auto_continue_single: bool = True
         self._last_error: Optional[str] = None
         self._last_scan_time: Optional[str] = None
-        self._beep_on: bool = bool(self._settings.get("beep_on", True))
-        self._log_visible: bool = bool(self._settings.get("log_visible", True))
+        self._beep_on: bool = True
+        self._log_visible: bool = True
+        self._save_pending: bool = False
+        self._save_writing: bool = False
+        self._save_task: Optional[asyncio.Task] = None
+        self._spinner_task: Optional[asyncio.Task] = None
+        self._debounce_timers: Dict[str, Timer] = {}
+        self._pending_path_update: bool = False
+        self._pending_input_save: bool = False
+        self._history_buffer: List[dict] = []
+        self._history_timer: Optional[Timer] = None
+        self._history_task: Optional[asyncio.Task] = None
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -320,7 +538,7 @@ class ScanTUI(App):
                     yield Button("Refresh", id="refresh", variant="primary")
                     yield Button("Continue", id="continue_button", variant="success")
                 yield Label("Select a scanner to continue.", id="select_status")
-                yield Label("Auto-continue: On (U)", id="auto_continue_label")
+                yield Label(_AUTO_ON_LABEL, id="auto_continue_label")
             with Vertical(id="scan_panel"):
                 yield Static("Scan Settings", classes="section-title")
                 yield Label("Selected scanner", classes="field-label")
@@ -340,7 +558,7 @@ class ScanTUI(App):
                 yield Label("Session scans", classes="field-label")
                 yield Static("0", id="session_count")
                 yield Label("Session total", classes="field-label")
-                yield Static("0.0 B", id="session_total")
+                yield Static("0 B", id="session_total")
                 yield Label("Avg time", classes="field-label")
                 yield Static("-", id="session_avg")
                 yield Label("Last scan", classes="field-label")
@@ -388,23 +606,70 @@ class ScanTUI(App):
                     yield Label("Idle", id="status_label")
                     yield LoadingIndicator(id="spinner")
                     yield Label("H help  Z log  ↑/↓ focus  Enter/Space scan  P prefix  T date  Y dir  1/2/3 presets  G gray  D dpi  O source  M format  V view  E dir  K beep  X clear err  S scan  L log", id="hint_label")
-                yield RichLog(id="log", highlight=True)
+                yield RichLog(id="log", highlight=True, max_lines=LOG_MAX_LINES, wrap=False)
         yield Footer()
 
     async def on_mount(self) -> None:
-        self.query_one("#spinner", LoadingIndicator).display = False
-        log = self.query_one("#log", RichLog)
+        self._w_session_count = self.query_one("#session_count", Static)
+        self._w_session_total = self.query_one("#session_total", Static)
+        self._w_session_avg = self.query_one("#session_avg", Static)
+        self._w_last_saved = self.query_one("#last_saved", Static)
+        self._w_last_scan_info = self.query_one("#last_scan_info", Static)
+        self._w_last_scan_time = self.query_one("#last_scan_time", Static)
+        self._w_last_error = self.query_one("#last_error", Static)
+        self._w_next_file = self.query_one("#next_file", Static)
+        self._w_ready = self.query_one("#ready_label", Static)
+        self._w_status = self.query_one("#status_label", Label)
+        self._w_spinner = self.query_one("#spinner", LoadingIndicator)
+        self._w_selected_scanner = self.query_one("#selected_scanner", Static)
+        self._w_prefix_input = self.query_one("#prefix_input", Input)
+        self._w_output_dir = self.query_one("#output_dir_input", Input)
+        self._w_format_select = self.query_one("#format_select", Select)
+        self._w_resolution_input = self.query_one("#resolution_input", Input)
+        self._w_mode_select = self.query_one("#mode_select", Select)
+        self._w_source_select = self.query_one("#source_select", Select)
+        self._w_extra_input = self.query_one("#extra_input", Input)
+        self._w_scanner_select = self.query_one("#scanner_select", Select)
+        self._w_log = self.query_one("#log", RichLog)
+        self._w_select_status = self.query_one("#select_status", Label)
+        self._w_auto_continue_label = self.query_one("#auto_continue_label", Label)
+        self._w_beep_status = self.query_one("#beep_status", Static)
+        self._w_select_panel = self.query_one("#select_panel", Vertical)
+        self._w_scan_panel = self.query_one("#scan_panel", Vertical)
+        self._w_scan_button = self.query_one("#scan_button", Button)
+        self._w_advanced_panel = self.query_one("#advanced_panel", Vertical)
+        self._w_advanced_hint = self.query_one("#advanced_hint", Label)
+        self._w_advanced_button = self.query_one("#advanced_button", Button)
+        self._w_free_space = self.query_one("#free_space", Static)
+        # Hot keys skip Textual's string-based binding dispatch.
+        self._fast_actions = {
+            "space": self.action_scan,
+            "d": self.action_cycle_resolution,
+            "m": self.action_toggle_format,
+        }
+
+        self._w_spinner.display = False
         try:
-            log.can_focus = True
+            self._w_log.can_focus = True
         except Exception:
             pass
+        self._settings = await asyncio.to_thread(self._load_settings)
+        self._written_settings = dict(self._settings)
         self._apply_scan_settings()
         self._set_advanced(self._advanced)
         self._set_stage("select")
         await self.action_refresh_scanners()
 
+    async def on_unmount(self) -> None:
+        if self._pending_input_save:
+            self._pending_input_save = False
+            self._save_pending = True
+        await self._flush_settings_now()
+        await self._flush_history_now()
+        self._reap_xdg_procs()
+
     def log_message(self, message: str) -> None:
-        log = self.query_one("#log", RichLog)
+        log = self._w_log
         log.write(message)
         try:
             log.scroll_end(animate=False)
@@ -413,107 +678,112 @@ class ScanTUI(App):
 
     def set_last_error(self, message: str) -> None:
         self._last_error = message
-        label = self.query_one("#last_error", Static)
+        label = self._w_last_error
         label.update(message)
         label.styles.color = "red" if message and message != "-" else "#9aa2ad"
         if message and message != "-":
-            self.log_message(f"[red]Last error:[/red] {message}")
+            self.log_message(_MSG_LAST_ERROR.format(message=message))
 
     def _update_session_stats(self) -> None:
-        self.query_one("#session_count", Static).update(str(self._session_scans))
-        self.query_one("#session_total", Static).update(format_bytes(self._session_bytes))
+        self._w_session_count.update(str(self._session_scans))
+        self._w_session_total.update(format_bytes(self._session_bytes))
         if self._session_scans:
             avg = self._session_total_seconds / self._session_scans
-            self.query_one("#session_avg", Static).update(f"{avg:.2f}s")
+            self._w_session_avg.update(f"{avg:.2f}s")
         else:
-            self.query_one("#session_avg", Static).update("-")
+            self._w_session_avg.update("-")
 
     def active_device(self) -> Optional[str]:
-        select = self.query_one("#scanner_select", Select)
-        value = select.value
-        if not value:
-            return None
-        if value is Select.BLANK:
-            return None
-        if value.__class__.__name__ == "NoSelection":
-            return None
-        return str(value)
+        return self._active_device
+
+    def _sync_active_device(self, value: object = None) -> None:
+        if value is None:
+            value = self._w_scanner_select.value
+        if not value or value is Select.BLANK or value.__class__.__name__ == "NoSelection":
+            self._active_device = None
+        else:
+            self._active_device = str(value)
 
     def set_status(self, message: str, busy: bool = False) -> None:
-        self.query_one("#status_label", Label).update(message)
-        spinner = self.query_one("#spinner", LoadingIndicator)
-        spinner.display = busy
+        self._w_status.update(message)
+        # Only show the spinner for slow operations; it animates on a timer.
+        if busy:
+            if self._spinner_task is None or self._spinner_task.done():
+                self._spinner_task = asyncio.create_task(self._spinner_after(SPINNER_DELAY))
+            return
+        if self._spinner_task is not None:
+            self._spinner_task.cancel()
+            self._spinner_task = None
+        self._w_spinner.display = False
+
+    async def _spinner_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._w_spinner.display = True
 
     def set_ready_message(self, message: str) -> None:
-        self.query_one("#ready_label", Static).update(message)
+        self._w_ready.update(message)
 
     def set_beep_status(self) -> None:
         label = "On (K)" if self._beep_on else "Off (K)"
-        self.query_one("#beep_status", Static).update(label)
+        self._w_beep_status.update(label)
 
     def _apply_log_visibility(self) -> None:
-        log = self.query_one("#log", RichLog)
-        log.styles.display = "block" if self._log_visible else "none"
+        self._w_log.styles.display = "block" if self._log_visible else "none"
 
     def set_select_status(self, message: str) -> None:
-        self.query_one("#select_status", Label).update(message)
-        auto_label = "On" if self._auto_continue_single else "Off"
-        self.query_one("#auto_continue_label", Label).update(f"Auto-continue: {auto_label} (U)")
+        self._w_select_status.update(message)
+        self._w_auto_continue_label.update(_AUTO_ON_LABEL if self._auto_continue_single else _AUTO_OFF_LABEL)
 
     def _set_stage(self, stage: str) -> None:
-        self._stage = stage
-        is_select = stage == "select"
-        select_panel = self.query_one("#select_panel", Vertical)
-        scan_panel = self.query_one("#scan_panel", Vertical)
-        select_panel.styles.display = "block" if is_select else "none"
-        scan_panel.styles.display = "none" if is_select else "block"
-        if is_select:
-            self.set_status("Select a scanner", busy=False)
-            self.set_select_status("Select a scanner to continue.")
-            try:
-                self.query_one("#scanner_select", Select).focus()
-            except Exception:
-                pass
-        else:
-            self._set_advanced(self._advanced)
-            self._update_scanner_detail(self.active_device())
-            self._update_next_filename()
-            self.set_ready_message("Place next page and press Space.")
-            self.set_beep_status()
-            self._apply_log_visibility()
-            if self._last_saved:
-                self.query_one("#last_saved", Static).update(str(self._last_saved))
-            self._update_session_stats()
-            if self._last_scan_seconds is not None:
-                self.query_one("#last_scan_info", Static).update(f"{self._last_scan_seconds:.2f}s")
-            if self._last_scan_time:
-                self.query_one("#last_scan_time", Static).update(self._last_scan_time)
-            if self._last_error:
-                self.query_one("#last_error", Static).update(self._last_error)
-            try:
-                self.query_one("#scan_button", Button).focus()
-            except Exception:
-                pass
+        with self.batch_update():
+            self._stage = stage
+            is_select = stage == "select"
+            self._w_select_panel.styles.display = "block" if is_select else "none"
+            self._w_scan_panel.styles.display = "none" if is_select else "block"
+            if is_select:
+                self.set_status("Select a scanner", busy=False)
+                self.set_select_status("Select a scanner to continue.")
+                try:
+                    self._w_scanner_select.focus()
+                except Exception:
+                    pass
+            else:
+                self._set_advanced(self._advanced)
+                self._update_scanner_detail(self.active_device())
+                self._update_next_filename()
+                self.set_ready_message("Place next page and press Space.")
+                self.set_beep_status()
+                self._apply_log_visibility()
+                if self._last_saved:
+                    self._w_last_saved.update(str(self._last_saved))
+                self._update_session_stats()
+                if self._last_scan_seconds is not None:
+                    self._w_last_scan_info.update(f"{self._last_scan_seconds:.2f}s")
+                if self._last_scan_time:
+                    self._w_last_scan_time.update(self._last_scan_time)
+                if self._last_error:
+                    self._w_last_error.update(self._last_error)
+                try:
+                    self._w_scan_button.focus()
+                except Exception:
+                    pass
 
     def _set_advanced(self, enabled: bool) -> None:
         self._advanced = enabled
-        panel = self.query_one("#advanced_panel", Vertical)
-        hint = self.query_one("#advanced_hint", Label)
-        button = self.query_one("#advanced_button", Button)
-        panel.styles.display = "block" if enabled else "none"
-        hint.styles.display = "none" if enabled else "block"
-        button.label = "Simple" if enabled else "Advanced"
+        self._w_advanced_panel.styles.display = "block" if enabled else "none"
+        self._w_advanced_hint.styles.display = "none" if enabled else "block"
+        self._w_advanced_button.label = "Simple" if enabled else "Advanced"
         try:
-            self.query_one("#mode_select", Select).disabled = not enabled
-            self.query_one("#source_select", Select).disabled = not enabled
-            self.query_one("#resolution_input", Input).disabled = not enabled
-            self.query_one("#format_select", Select).disabled = not enabled
-            self.query_one("#extra_input", Input).disabled = not enabled
+            self._w_mode_select.disabled = not enabled
+            self._w_source_select.disabled = not enabled
+            self._w_resolution_input.disabled = not enabled
+            self._w_format_select.disabled = not enabled
+            self._w_extra_input.disabled = not enabled
         except Exception:
             pass
 
     def _set_select_options(self, options: Iterable[Tuple[str, str]]) -> None:
-        select = self.query_one("#scanner_select", Select)
+        select = self._w_scanner_select
         options_list = list(options)
         try:
             select.set_options(options_list)
@@ -528,63 +798,61 @@ class ScanTUI(App):
             except AttributeError:
                 # Fallback for older Textual versions
                 select.value = options_list[0][1] if options_list else ""
+        self._sync_active_device()
 
     async def action_refresh_scanners(self) -> None:
         self.set_status("Refreshing scanners…", busy=True)
         self.set_select_status("Scanning for devices…")
         self.log_message("[bold]Scanning for devices…[/bold]")
         try:
-            result = await asyncio.to_thread(
-                subprocess.run,
-                ["scanimage", "-L"],
-                capture_output=True,
-                text=True,
-                timeout=12,
-            )
+            returncode, stdout, stderr = await run_process(["scanimage", "-L"], timeout=12)
         except FileNotFoundError:
             self.set_status("scanimage not found", busy=False)
             self.set_select_status("scanimage not found.")
             self.log_message("[red]Error:[/red] scanimage not found. Install SANE tools.")
             return
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             self.set_status("Scan timed out", busy=False)
             self.set_select_status("scanimage -L timed out.")
             self.log_message("[red]Error:[/red] scanimage -L timed out.")
             return
 
-        if result.returncode != 0:
+        if returncode != 0:
             self.set_status("Scan failed", busy=False)
             self.set_select_status("scanimage -L failed.")
-            self.log_message(f"[red]scanimage error:[/red] {result.stderr.strip() or result.stdout.strip()}")
+            self.log_message(f"[red]scanimage error:[/red] {stderr.strip() or stdout.strip()}")
             return
 
-        scanners = parse_scanimage_list(result.stdout)
+        scanners = parse_scanimage_list(stdout)
         self._scanners = scanners
+        self._scanner_by_device = {s.device: s for s in scanners}
         if not scanners:
             self._set_select_options([])
-            self.query_one("#selected_scanner", Static).update("-")
+            self._w_selected_scanner.update("-")
             self.set_status("No scanners found", busy=False)
             self.set_select_status("No scanners found.")
             self.log_message("[yellow]No scanners detected.[/yellow]")
             return
 
         options = [(f"{s.name} [{short_device(s.device)}]", s.device) for s in scanners]
-        self._set_select_options(options)
-        preferred = self._settings.get("last_device")
-        if preferred and any(s.device == preferred for s in scanners):
-            self.query_one("#scanner_select", Select).value = preferred
-        self.set_status(f"Found {len(scanners)} scanner(s)", busy=False)
-        self.set_select_status(f"Found {len(scanners)} scanner(s).")
-        self._update_scanner_detail(self.active_device())
-        if self._auto_continue_single and len(scanners) == 1 and self._stage == "select":
-            self._set_stage("scan")
+        with self.batch_update():
+            self._set_select_options(options)
+            preferred = self._settings.get("last_device")
+            if preferred and preferred in self._scanner_by_device:
+                self._w_scanner_select.value = preferred
+                self._sync_active_device()
+            self.set_status(f"Found {len(scanners)} scanner(s)", busy=False)
+            self.set_select_status(f"Found {len(scanners)} scanner(s).")
+            self._update_scanner_detail(self.active_device())
+            if self._auto_continue_single and len(scanners) == 1 and self._stage == "select":
+                self._set_stage("scan")
 
     def _update_scanner_detail(self, device: Optional[str]) -> None:
-        detail = self.query_one("#selected_scanner", Static)
+        detail = self._w_selected_scanner
         if not device:
             detail.update("-")
             return
-        scanner = next((s for s in self._scanners if s.device == device), None)
+        scanner = self._scanner_by_device.get(device)
         if not scanner:
             detail.update(device)
             return
@@ -621,7 +889,7 @@ class ScanTUI(App):
             self.set_last_error("No scanner selected")
             return False
 
-        prefix_input = self.query_one("#prefix_input", Input)
+        prefix_input = self._w_prefix_input
         prefix = sanitize_prefix(prefix_input.value)
         if prefix != prefix_input.value:
             prefix_input.value = prefix
@@ -636,17 +904,24 @@ class ScanTUI(App):
             self.set_last_error("Output directory error")
             return False
 
-        fmt = (self.query_one("#format_select", Select).value or "png").lower()
-        ext = "jpg" if fmt == "jpeg" else fmt
-        resolution = safe_int(self.query_one("#resolution_input", Input).value.strip(), 300)
-        mode = self.query_one("#mode_select", Select).value or ""
-        source = self.query_one("#source_select", Select).value or ""
-        extra = self.query_one("#extra_input", Input).value.strip()
+        fmt = (self._w_format_select.value or "png").lower()
+        ext = _FMT_TO_EXT.get(fmt, fmt)
+        resolution = safe_int(self._w_resolution_input.value.strip(), 300)
+        mode = self._w_mode_select.value or ""
+        source = self._w_source_select.value or ""
+        extra = self._w_extra_input.value.strip()
 
         index = next_index(prefix, output_dir, ext)
-        filename = output_dir / f"{prefix}_{index:04d}.{ext}"
-
-        cmd = ["scanimage", "-d", device, "--format", fmt, "--output-file", str(filename)]
+        name = f"{prefix}_{index:04d}.{ext}"
+        full = os.path.join(output_dir, name)
+        if os.path.exists(full):
+            # Coarse or cached directory mtimes (vfat, NFS/SMB) can leave the cache stale; never overwrite.
+            forget_index(prefix, output_dir, ext)
+            index = next_index(prefix, output_dir, ext)
+            name = f"{prefix}_{index:04d}.{ext}"
+            full = os.path.join(output_dir, name)
+
+        cmd = ["scanimage", "-d", device, "--format", fmt, "--output-file", full]
         if resolution:
             cmd += ["--resolution", str(resolution)]
         if mode:
@@ -661,70 +936,62 @@ class ScanTUI(App):
                 self.set_last_error("Extra options parse error")
                 return False
 
-        self.set_status(f"Scanning {filename.name}…", busy=True)
-        self.log_message(f"[cyan]Scanning[/cyan] {filename.name} on {short_device(device)}")
+        self.set_status(f"Scanning {name}…", busy=True)
+        self.log_message(_MSG_SCAN_START.format(name=name, dev=short_device(device)))
         started = monotonic()
         try:
-            result = await asyncio.to_thread(
-                subprocess.run,
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-        except subprocess.TimeoutExpired:
+            returncode, stdout, stderr = await run_process(cmd, timeout=120)
+        except asyncio.TimeoutError:
             self.set_status("Scan timed out", busy=False)
             self.log_message("[red]Scan timed out.[/red]")
             self.set_last_error("Scan timed out")
             return False
 
-        if result.returncode != 0:
+        if returncode != 0:
             self.set_status("Scan failed", busy=False)
-            error = result.stderr.strip() or result.stdout.strip() or "Unknown error"
-            self.log_message(f"[red]scanimage failed:[/red] {error}")
+            error = stderr.strip() or stdout.strip() or "Unknown error"
+            self.log_message(_MSG_SCAN_FAILED.format(error=error))
             self.set_last_error("Scan failed")
             return False
 
-        self.set_status("Scan complete", busy=False)
         duration = monotonic() - started
         self._last_scan_seconds = duration
         size_info = ""
         size_bytes = None
         try:
-            size_bytes = filename.stat().st_size
+            size_bytes = os.stat(full).st_size
             size_info = f" ({format_bytes(size_bytes)})"
         except Exception:
             size_info = ""
-        self.log_message(f"[green]Saved:[/green] {filename}{size_info} in {duration:.2f}s")
+        self.log_message(_MSG_SAVED.format(path=full, size=size_info, secs=duration))
         if self._beep_on:
-            try:
-                sys.stdout.write("\a")
-                sys.stdout.flush()
-            except Exception:
-                pass
-        self._last_saved = filename
-        self.query_one("#last_saved", Static).update(f"{filename}{size_info}")
-        self.query_one("#last_scan_info", Static).update(f"{duration:.2f}s{size_info}")
+            self.bell()
+        self._last_saved = Path(full)
         self._last_scan_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.query_one("#last_scan_time", Static).update(self._last_scan_time)
-        self.set_last_error("-")
-        self.set_ready_message("Ready for next page. Press Space.")
         self._session_scans += 1
         if size_bytes is not None:
             self._session_bytes += size_bytes
         self._session_total_seconds += duration
-        self._update_session_stats()
+        remember_index(prefix, output_dir, ext, index)
+        with self.batch_update():
+            self.set_status("Scan complete", busy=False)
+            self._w_last_saved.update(f"{full}{size_info}")
+            self._w_last_scan_info.update(f"{duration:.2f}s{size_info}")
+            self._w_last_scan_time.update(self._last_scan_time)
+            self.set_last_error("-")
+            self.set_ready_message("Ready for next page. Press Space.")
+            self._update_session_stats()
+            self._update_next_filename()
         self._append_history_entry(
-            filename=filename,
+            filename=full,
             size_bytes=size_bytes,
             duration=duration,
         )
-        self._save_settings()
-        self._update_next_filename()
+        self._schedule_save()
         return True
 
     async def action_clear_log(self) -> None:
-        self.query_one("#log", RichLog).clear()
+        self._w_log.clear()
         self.log_message("Log cleared.")
 
     async def action_back(self) -> None:
@@ -744,54 +1011,54 @@ class ScanTUI(App):
     async def action_focus_prefix(self) -> None:
         if self._stage != "scan":
             return
-        self.query_one("#prefix_input", Input).focus()
+        self._w_prefix_input.focus()
 
     async def action_focus_scan(self) -> None:
         if self._stage != "scan":
             return
-        self.query_one("#scan_button", Button).focus()
+        self._w_scan_button.focus()
 
     async def action_focus_log(self) -> None:
         if self._stage != "scan":
             return
-        self.query_one("#log", RichLog).focus()
+        self._w_log.focus()
 
     async def action_set_date_prefix(self) -> None:
         if self._stage != "scan":
             return
         prefix = datetime.now().strftime("%Y%m%d")
-        self.query_one("#prefix_input", Input).value = prefix
+        self._set_input_quietly(self._w_prefix_input, prefix)
         self._update_next_filename()
-        self._save_settings()
+        self._schedule_save()
 
     async def action_toggle_gray(self) -> None:
         if self._stage != "scan":
             return
-        mode_select = self.query_one("#mode_select", Select)
+        mode_select = self._w_mode_select
         current = (mode_select.value or "").lower()
         new_mode = "Gray" if current != "gray" else "Color"
         mode_select.value = new_mode
-        self._save_settings()
-        self.log_message(f"[blue]Mode:[/blue] {new_mode}")
+        self._schedule_save()
+        self.log_message(_MSG_MODE.format(value=new_mode))
 
     async def action_cycle_resolution(self) -> None:
         if self._stage != "scan":
             return
-        input_widget = self.query_one("#resolution_input", Input)
+        input_widget = self._w_resolution_input
         current = safe_int(input_widget.value.strip(), RESOLUTION_PRESETS[0])
         if current in RESOLUTION_PRESETS:
             idx = RESOLUTION_PRESETS.index(current)
             new_value = RESOLUTION_PRESETS[(idx + 1) % len(RESOLUTION_PRESETS)]
         else:
             new_value = RESOLUTION_PRESETS[0]
-        input_widget.value = str(new_value)
-        self._save_settings()
-        self.log_message(f"[blue]Resolution:[/blue] {new_value} DPI")
+        self._set_input_quietly(input_widget, str(new_value))
+        self._schedule_save()
+        self.log_message(_MSG_RESOLUTION.format(value=new_value))
 
     async def action_toggle_source(self) -> None:
         if self._stage != "scan":
             return
-        source_select = self.query_one("#source_select", Select)
+        source_select = self._w_source_select
         options = SOURCE_OPTIONS
         current = source_select.value or ""
         if current in options:
@@ -800,14 +1067,14 @@ class ScanTUI(App):
         else:
             new_value = options[0] if options else ""
         source_select.value = new_value
-        self._save_settings()
+        self._schedule_save()
         label = new_value if new_value else "Default"
-        self.log_message(f"[blue]Source:[/blue] {label}")
+        self.log_message(_MSG_SOURCE.format(value=label))
 
     async def action_toggle_format(self) -> None:
         if self._stage != "scan":
             return
-        format_select = self.query_one("#format_select", Select)
+        format_select = self._w_format_select
         options = FORMAT_OPTIONS
         current = format_select.value or ""
         if current in options:
@@ -817,8 +1084,8 @@ class ScanTUI(App):
             new_value = options[0] if options else "png"
         format_select.value = new_value
         self._update_next_filename()
-        self._save_settings()
-        self.log_message(f"[blue]Format:[/blue] {new_value.upper()}")
+        self._schedule_save()
+        self.log_message(_MSG_FORMAT.format(value=new_value.upper()))
 
     async def action_open_last(self) -> None:
         if self._stage != "scan":
@@ -827,8 +1094,9 @@ class ScanTUI(App):
             self.log_message("[yellow]No last scan to open.[/yellow]")
             return
         try:
-            await asyncio.to_thread(subprocess.run, ["xdg-open", str(self._last_saved)], check=False)
-            self.log_message(f"[green]Opened:[/green] {self._last_saved}")
+            if not self._xdg_open(self._last_saved):
+                return
+            self.log_message(_MSG_OPENED.format(path=self._last_saved))
         except FileNotFoundError:
             self.log_message("[red]xdg-open not found.[/red]")
         except Exception as exc:
@@ -842,19 +1110,46 @@ class ScanTUI(App):
             self.log_message("[yellow]Output directory not set.[/yellow]")
             return
         try:
-            await asyncio.to_thread(subprocess.run, ["xdg-open", str(output_dir)], check=False)
-            self.log_message(f"[green]Opened:[/green] {output_dir}")
+            if not self._xdg_open(output_dir):
+                return
+            self.log_message(_MSG_OPENED.format(path=output_dir))
         except FileNotFoundError:
             self.log_message("[red]xdg-open not found.[/red]")
         except Exception as exc:
             self.log_message(f"[red]Failed to open dir:[/red] {exc}")
 
+    def _xdg_open(self, target: Path) -> bool:
+        # Held V/E keys would otherwise fork one viewer per key repeat.
+        key = str(target)
+        now = monotonic()
+        if now - self._last_xdg_open.get(key, float("-inf")) < XDG_OPEN_INTERVAL:
+            self.log_message(f"[yellow]Already opening:[/yellow] {key}")
+            return False
+        self._last_xdg_open = {
+            path: opened for path, opened in self._last_xdg_open.items() if now - opened < XDG_OPEN_INTERVAL
+        }
+        self._last_xdg_open[key] = now
+        self._reap_xdg_procs()
+        self._xdg_procs.append(
+            subprocess.Popen(
+                ["xdg-open", str(target)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        )
+        return True
+
+    def _reap_xdg_procs(self) -> None:
+        # Keep handles so exited xdg-open processes are waited on instead of lingering as zombies.
+        self._xdg_procs = [proc for proc in self._xdg_procs if proc.poll() is None]
+
     async def action_toggle_auto_continue(self) -> None:
         self._auto_continue_single = not self._auto_continue_single
-        self._save_settings()
+        self._schedule_save()
         self.set_select_status("Select a scanner to continue.")
         state = "On" if self._auto_continue_single else "Off"
-        self.log_message(f"[blue]Auto-continue:[/blue] {state}")
+        self.log_message(_MSG_AUTO_CONTINUE.format(value=state))
 
     async def action_clear_last_error(self) -> None:
         self.set_last_error("-")
@@ -862,53 +1157,48 @@ class ScanTUI(App):
     async def action_set_date_dir(self) -> None:
         if self._stage != "scan":
             return
-        output_input = self.query_one("#output_dir_input", Input)
-        base_path = Path(output_input.value.strip() or "./scans").expanduser()
+        base_path = self._output_dir_path() or DEFAULT_OUTPUT_DIR
         if is_date_dir(base_path.name):
             base_path = base_path.parent
-        dated = base_path / datetime.now().strftime("%Y-%m-%d")
-        output_input.value = str(dated)
+        dated = base_path / date.today().isoformat()
+        self._set_input_quietly(self._w_output_dir, str(dated))
         self._update_free_space()
         self._update_next_filename()
-        self._save_settings()
-        self.log_message(f"[blue]Output dir:[/blue] {dated}")
+        self._schedule_save()
+        self.log_message(_MSG_OUTPUT_DIR.format(value=dated))
 
     async def action_show_help(self) -> None:
         if self._stage != "scan":
             return
-        self.log_message("[bold]Keyboard cheatsheet[/bold]")
-        self.log_message("Space/Enter: Scan   P: Prefix   T: Date prefix   Y: Date dir")
-        self.log_message("1: Doc preset  2: Photo preset  3: Draft preset")
-        self.log_message("G: Gray toggle  D: DPI cycle  O: Source cycle  M: Format cycle")
-        self.log_message("V: Open last  E: Open dir  K: Beep  Z: Log  X: Clear error  U: Auto-continue")
+        self.log_message(HELP_TEXT)
 
     async def action_toggle_beep(self) -> None:
         if self._stage != "scan":
             return
         self._beep_on = not self._beep_on
         self.set_beep_status()
-        self._save_settings()
+        self._schedule_save()
         state = "On" if self._beep_on else "Off"
-        self.log_message(f"[blue]Beep:[/blue] {state}")
+        self.log_message(_MSG_BEEP.format(value=state))
 
     async def action_toggle_log(self) -> None:
         if self._stage != "scan":
             return
         self._log_visible = not self._log_visible
         self._apply_log_visibility()
-        self._save_settings()
+        self._schedule_save()
         state = "Shown" if self._log_visible else "Hidden"
-        self.log_message(f"[blue]Log:[/blue] {state}")
+        self.log_message(_MSG_LOG.format(value=state))
 
     def _apply_preset(self, label: str, resolution: int, mode: str, fmt: str) -> None:
         if self._focus_is_inputlike():
             return
-        self.query_one("#resolution_input", Input).value = str(resolution)
-        self.query_one("#mode_select", Select).value = mode
-        self.query_one("#format_select", Select).value = fmt
+        self._set_input_quietly(self._w_resolution_input, str(resolution))
+        self._w_mode_select.value = mode
+        self._w_format_select.value = fmt
         self._update_next_filename()
-        self._save_settings()
-        self.log_message(f"[magenta]Preset:[/magenta] {label}")
+        self._schedule_save()
+        self.log_message(_MSG_PRESET.format(value=label))
 
     async def action_preset_doc(self) -> None:
         if self._stage != "scan":
@@ -925,63 +1215,119 @@ class ScanTUI(App):
             return
         self._apply_preset("Draft (150dpi Gray PNG)", 150, "Gray", "png")
 
-    def _append_history_entry(self, filename: Path, size_bytes: Optional[int], duration: float) -> None:
+    def _append_history_entry(self, filename: str, size_bytes: Optional[int], duration: float) -> None:
         try:
             record = {
                 "timestamp": datetime.now().isoformat(timespec="seconds"),
-                "file": str(filename),
+                "file": filename,
                 "size_bytes": size_bytes,
                 "duration_seconds": round(duration, 3),
                 "device": self.active_device(),
-                "format": self.query_one("#format_select", Select).value or "png",
-                "resolution": self.query_one("#resolution_input", Input).value.strip(),
-                "mode": self.query_one("#mode_select", Select).value or "",
-                "source": self.query_one("#source_select", Select).value or "",
+                "format": self._w_format_select.value or "png",
+                "resolution": self._w_resolution_input.value.strip(),
+                "mode": self._w_mode_select.value or "",
+                "source": self._w_source_select.value or "",
             }
-            append_history(HISTORY_PATH, record)
         except Exception:
             return
+        self._history_buffer.append(record)
+        if self._history_timer is None:
+            self._history_timer = self.set_timer(HISTORY_FLUSH_DELAY, self._flush_history)
+
+    def _flush_history(self) -> None:
+        self._history_timer = None
+        if self._history_task is not None and not self._history_task.done():
+            # A write is still running; it picks up the new records when done.
+            return
+        self._history_task = asyncio.create_task(self._write_history())
+
+    async def _write_history(self) -> None:
+        while self._history_buffer:
+            records, self._history_buffer = self._history_buffer, []
+            try:
+                await asyncio.to_thread(append_history_batch, HISTORY_PATH, records)
+            except Exception:
+                return
+
+    async def _flush_history_now(self) -> None:
+        if self._history_timer is not None:
+            self._history_timer.stop()
+            self._history_timer = None
+        if self._history_task is not None and not self._history_task.done():
+            await self._history_task
+        if self._history_buffer:
+            records, self._history_buffer = self._history_buffer, []
+            try:
+                append_history_batch(HISTORY_PATH, records)
+            except Exception:
+                return
 
     def _load_settings(self) -> dict:
         try:
-            with CONFIG_PATH.open("r", encoding="utf-8") as handle:
-                return json.load(handle)
+            return _json_loads(CONFIG_PATH.read_bytes())
         except FileNotFoundError:
             return {}
         except Exception:
             return {}
 
-    def _save_settings(self) -> None:
-        data = {
-            "prefix": self.query_one("#prefix_input", Input).value.strip(),
-            "output_dir": self.query_one("#output_dir_input", Input).value.strip(),
-            "format": self.query_one("#format_select", Select).value or "png",
-            "resolution": self.query_one("#resolution_input", Input).value.strip(),
-            "mode": self.query_one("#mode_select", Select).value or "",
-            "source": self.query_one("#source_select", Select).value or "",
-            "extra": self.query_one("#extra_input", Input).value.strip(),
+    def _schedule_save(self) -> None:
+        self._save_pending = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._flush_settings())
+
+    async def _flush_settings(self) -> None:
+        await asyncio.sleep(SETTINGS_SAVE_DELAY)
+        # Changes made while a write is in flight are picked up by the next pass.
+        while self._save_pending:
+            self._save_pending = False
+            data = self._collect_settings()
+            if data == self._written_settings:
+                continue
+            self._save_writing = True
+            try:
+                if await asyncio.to_thread(write_settings, CONFIG_PATH, data):
+                    self._written_settings = data
+            finally:
+                self._save_writing = False
+
+    async def _flush_settings_now(self) -> None:
+        task = self._save_task
+        if task is not None and not task.done():
+            if self._save_writing:
+                await task
+                return
+            task.cancel()
+        if self._save_pending:
+            self._save_pending = False
+            data = self._collect_settings()
+            if data != self._written_settings and write_settings(CONFIG_PATH, data):
+                self._written_settings = data
+
+    def _collect_settings(self) -> dict:
+        return {
+            "prefix": self._w_prefix_input.value.strip(),
+            "output_dir": self._w_output_dir.value.strip(),
+            "format": self._w_format_select.value or "png",
+            "resolution": self._w_resolution_input.value.strip(),
+            "mode": self._w_mode_select.value or "",
+            "source": self._w_source_select.value or "",
+            "extra": self._w_extra_input.value.strip(),
             "last_device": self.active_device(),
             "advanced": self._advanced,
             "auto_continue_single": self._auto_continue_single,
             "beep_on": self._beep_on,
             "log_visible": self._log_visible,
         }
-        CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            with CONFIG_PATH.open("w", encoding="utf-8") as handle:
-                json.dump(data, handle, indent=2, sort_keys=True)
-        except Exception:
-            return
 
     def _apply_scan_settings(self) -> None:
         settings = self._settings
-        self.query_one("#prefix_input", Input).value = settings.get("prefix", "scan")
-        self.query_one("#output_dir_input", Input).value = settings.get("output_dir", "./scans")
-        self.query_one("#format_select", Select).value = settings.get("format", "png")
-        self.query_one("#resolution_input", Input).value = settings.get("resolution", "300")
-        self.query_one("#mode_select", Select).value = settings.get("mode", "Color")
-        self.query_one("#source_select", Select).value = settings.get("source", "Flatbed")
-        self.query_one("#extra_input", Input).value = settings.get("extra", "")
+        self._set_input_quietly(self._w_prefix_input, settings.get("prefix", "scan"))
+        self._set_input_quietly(self._w_output_dir, settings.get("output_dir", "./scans"))
+        self._set_input_quietly(self._w_resolution_input, settings.get("resolution", "300"))
+        self._set_input_quietly(self._w_extra_input, settings.get("extra", ""))
+        self._w_format_select.value = settings.get("format", "png")
+        self._w_mode_select.value = settings.get("mode", "Color")
+        self._w_source_select.value = settings.get("source", "Flatbed")
         self._advanced = bool(settings.get("advanced", False))
         self._auto_continue_single = bool(settings.get("auto_continue_single", True))
         self._beep_on = bool(settings.get("beep_on", True))
@@ -989,10 +1335,13 @@ class ScanTUI(App):
         self._update_free_space()
 
     def _output_dir_path(self) -> Optional[Path]:
-        output_dir_input = self.query_one("#output_dir_input", Input).value.strip()
-        if not output_dir_input:
-            return None
-        return Path(output_dir_input).expanduser()
+        raw = self._w_output_dir.value
+        if raw != self._output_dir_raw:
+            # Only re-expand when the input text actually changed.
+            stripped = raw.strip()
+            self._output_dir_raw = raw
+            self._output_dir_expanded = Path(stripped).expanduser() if stripped else None
+        return self._output_dir_expanded
 
     def _ensure_output_dir(self) -> Optional[Path]:
         output_dir = self._output_dir_path()
@@ -1012,29 +1361,27 @@ class ScanTUI(App):
             if output_dir is None:
                 output_dir = self._output_dir_path()
             if output_dir is None:
-                self.query_one("#free_space", Static).update("-")
+                self._w_free_space.update("-")
                 return
             probe = output_dir if output_dir.exists() else output_dir.parent
             if not probe.exists():
-                self.query_one("#free_space", Static).update("-")
+                self._w_free_space.update("-")
                 return
-            usage = shutil.disk_usage(str(probe))
-            self.query_one("#free_space", Static).update(format_bytes(usage.free))
+            self._w_free_space.update(format_bytes(free_bytes(probe)))
         except Exception:
-            self.query_one("#free_space", Static).update("-")
+            self._w_free_space.update("-")
 
     def _update_next_filename(self) -> None:
-        prefix_raw = self.query_one("#prefix_input", Input).value
+        prefix_raw = self._w_prefix_input.value
         prefix = sanitize_prefix(prefix_raw)
         if not prefix:
-            self.query_one("#next_file", Static).update("-")
+            self._w_next_file.update("-")
             return
-        output_dir = self._output_dir_path() or Path("./scans")
-        fmt = (self.query_one("#format_select", Select).value or "png").lower()
-        ext = "jpg" if fmt == "jpeg" else fmt
+        output_dir = self._output_dir_path() or DEFAULT_OUTPUT_DIR
+        fmt = (self._w_format_select.value or "png").lower()
+        ext = _FMT_TO_EXT.get(fmt, fmt)
         index = next_index(prefix, output_dir, ext)
-        filename = output_dir / f"{prefix}_{index:04d}.{ext}"
-        self.query_one("#next_file", Static).update(str(filename))
+        self._w_next_file.update(os.path.join(output_dir, f"{prefix}_{index:04d}.{ext}"))
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "refresh":
@@ -1059,79 +1406,80 @@ class ScanTUI(App):
 
     def on_select_changed(self, event: Select.Changed) -> None:
         if event.select.id == "scanner_select":
-            self._update_scanner_detail(event.value)
-            self._save_settings()
+            self._sync_active_device(event.value)
+            self._update_scanner_detail(self._active_device)
+            self._schedule_save()
         elif event.select.id == "format_select":
             self._update_next_filename()
-            self._save_settings()
+            self._schedule_save()
         elif event.select.id in {"mode_select", "source_select"}:
-            self._save_settings()
+            self._schedule_save()
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        if event.input.id in {"prefix_input", "output_dir_input"}:
-            self._update_next_filename()
-            self._update_free_space()
-        if event.input.id in {
+        input_id = event.input.id
+        if input_id in {"prefix_input", "output_dir_input"}:
+            self._pending_path_update = True
+        if input_id in {
             "prefix_input",
             "output_dir_input",
             "resolution_input",
             "extra_input",
         }:
-            self._save_settings()
+            self._pending_input_save = True
+            self._debounce_reset("inputs", INPUT_DEBOUNCE, self._flush_pending_input_changes)
+
+    def _set_input_quietly(self, widget: Input, value: str) -> None:
+        # Programmatic updates are not edits; callers refresh what they need.
+        with self.prevent(Input.Changed):
+            widget.value = value
+
+    def _debounce_reset(self, name: str, delay: float, callback: Callable[[], None]) -> None:
+        timer = self._debounce_timers.get(name)
+        if timer is not None:
+            timer.stop()
+        self._debounce_timers[name] = self.set_timer(delay, callback)
+
+    def _flush_pending_input_changes(self) -> None:
+        if self._pending_path_update:
+            self._pending_path_update = False
+            self._update_next_filename()
+            self._update_free_space()
+        if self._pending_input_save:
+            self._pending_input_save = False
+            self._schedule_save()
 
     def _focus_is_inputlike(self) -> bool:
-        focused = self.focused
-        if focused is None:
-            return False
-        if isinstance(focused, Input):
-            return True
-        if isinstance(focused, Select):
-            return True
-        if focused.__class__.__name__ == "SelectOverlay":
-            return True
-        return False
+        return isinstance(self.focused, _INPUTLIKE)
 
     async def on_key(self, event: events.Key) -> None:
-        if event.key in {"up", "down", "left", "right"}:
-            focused = self.focused
-            if isinstance(focused, RichLog):
-                event.stop()
-                if event.key == "up":
-                    focused.scroll_up(1)
-                elif event.key == "down":
-                    focused.scroll_down(1)
-                return
+        action = self._fast_actions.get(event.key)
+        if action is not None:
             if self._focus_is_inputlike():
                 return
             event.stop()
-            if event.key in {"up", "left"}:
-                self.action_focus_previous()
-            else:
-                self.action_focus_next()
+            event.prevent_default()
+            await action()
             return
 
-        if event.key in {"pageup", "pagedown", "home", "end"}:
-            focused = self.focused
-            if isinstance(focused, RichLog):
-                event.stop()
-                if event.key == "pageup":
-                    focused.scroll_page_up()
-                elif event.key == "pagedown":
-                    focused.scroll_page_down()
-                elif event.key == "home":
-                    focused.scroll_home()
-                else:
-                    focused.scroll_end()
-                return
+        key = event.key
+        if key in self._LOG_KEYS and isinstance(self.focused, RichLog):
+            event.stop()
+            method = self._LOG_SCROLL_METHODS.get(key)
+            if method is not None:
+                getattr(self.focused, method)()
+            return
 
-        if event.key == "space":
+        if key in self._ARROW_KEYS:
             if self._focus_is_inputlike():
                 return
             event.stop()
-            await self.action_scan()
+            if key in self._BACKWARD_KEYS:
+                self.action_focus_previous()
+            else:
+                self.action_focus_next()
             return
 
-        if event.key == "enter":
+        if key == "enter":
             if self._focus_is_inputlike():
                 return
             event.stop()